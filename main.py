@@ -5,6 +5,7 @@ import sys
 
 from tello_bridge import TelloBridge
 from tello_bridge.utils.logger import setup_logger, logger
+from tello_bridge.utils.serializer import WIRE_FORMATS, setup_serializer
 
 def parse_arguments():
     """Parse command-line arguments"""
@@ -15,6 +16,7 @@ def parse_arguments():
     parser.add_argument('--websocket-host', default='0.0.0.0', help='WebSocket host')
     parser.add_argument('--websocket-port', type=int, default=8765, help='WebSocket port')
     parser.add_argument('--video-port', type=int, default=8555, help='Video HTTP server port')
+    parser.add_argument('--wire-format', choices=WIRE_FORMATS, default='json', help='Encoding of messages sent to WebSocket clients')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
     
     return parser.parse_args()
@@ -29,6 +31,10 @@ async def main():
 
     logger.info("Debug mode is enabled" if args.debug else "Debug mode is disabled")
     
+    # Select the encoding of WebSocket messages
+    setup_serializer(args.wire_format)
+    logger.info(f"WebSocket wire format: {args.wire_format}")
+    
     # Create bridge instance
     bridge = TelloBridge(
         socket_host=args.socket_host,
@@ -3,9 +3,9 @@ import asyncio
 from typing import Optional, Tuple
 
 from .utils.logger import logger
-from .protocols.command_protocol import TelloProtocol, need_reconnect
+from .protocols.command_protocol import TelloProtocol
 from .protocols.state_protocol import TelloStateProtocol
-from .websocket import broadcast_to_websockets, start_websocket_server
+from .websocket import broadcast_to_websockets, start_websocket_server, stop_websocket_server
 
 class TelloBridge:
     """
@@ -32,6 +32,9 @@ class TelloBridge:
         # Tasks
         self.health_task = None
         
+        # Set by the command protocol when the UDP socket must be recreated
+        self.reconnect_event = None
+        
     async def start(self):
         """Start the bridge and all its components"""
         logger.info("Starting Tello WebSocket Bridge")
@@ -39,6 +42,8 @@ class TelloBridge:
         logger.info(f"Local UDP port: {self.local_port}")
         logger.info(f"WebSocket: {self.websocket_host}:{self.websocket_port}")
         
+        self.reconnect_event = asyncio.Event()
+        
         # Start the health monitor
         self.health_task = asyncio.create_task(self._health_monitor())
         
@@ -49,7 +54,8 @@ class TelloBridge:
         self.websocket_server = await start_websocket_server(
             self.websocket_host,
             self.websocket_port,
-            self.tello_protocol.send_to_tello if self.tello_protocol else None
+            # Resolve the protocol at send time, it is replaced on reconnection
+            self.send_to_tello
         )
         
         # Main loop to handle reconnection requests
@@ -67,10 +73,20 @@ class TelloBridge:
         """Create a UDP socket for sending commands to Tello"""
         loop = asyncio.get_running_loop()
         tello_addr = (self.socket_host, self.socket_port)
-        transport, protocol = await loop.create_datagram_endpoint(
-            lambda: TelloProtocol(tello_addr, broadcast_to_websockets),
-            local_addr=('0.0.0.0', self.local_port)  # Bind to specified local port
-        )
+        protocol_factory = lambda: TelloProtocol(tello_addr, broadcast_to_websockets, self.reconnect_event)
+        try:
+            transport, protocol = await loop.create_datagram_endpoint(
+                protocol_factory,
+                local_addr=('0.0.0.0', self.local_port),  # Bind to specified local port
+                remote_addr=tello_addr  # Connect to Tello so sendto needs no address
+            )
+        except OSError as e:
+            # No route to the Tello yet (e.g. not on its Wi-Fi), wait for it with an unconnected socket
+            logger.warning(f"Cannot connect UDP socket to Tello ({e}), using an unconnected socket")
+            transport, protocol = await loop.create_datagram_endpoint(
+                protocol_factory,
+                local_addr=('0.0.0.0', self.local_port)
+            )
         return transport, protocol
     
     async def _create_state_socket(self) -> Tuple:
@@ -82,64 +98,127 @@ class TelloBridge:
         )
         return transport, protocol
     
-    async def _health_monitor(self, check_interval=10):
-        """Monitor the health of the Tello connection"""
-        global need_reconnect
+    async def _health_monitor(self, check_interval=10, response_timeout=15):
+        """
+        Monitor the health of the Tello connection
+        
+        While the connection is healthy, the monitor sleeps for the time left until
+        the last response would become older than response_timeout, but never less
+        than check_interval (so between check_interval and response_timeout seconds).
+        Before the first response, or while a stale connection is being checked, it
+        sleeps check_interval seconds.
+        """
+        loop_time = asyncio.get_running_loop().time
         
         while True:
-            await asyncio.sleep(check_interval)
+            sleep_time = check_interval
             
-            if self.tello_protocol and self.tello_protocol.connected:
-                # Check if we've received any response in the last 15 seconds
-                current_time = asyncio.get_event_loop().time()
+            if self.tello_protocol and self.tello_protocol.connected and self.tello_protocol.last_response_time > 0:
+                current_time = loop_time()
                 time_since_last_response = current_time - self.tello_protocol.last_response_time
                 
-                if self.tello_protocol.last_response_time > 0 and time_since_last_response > 15:
+                if time_since_last_response > response_timeout:
                     logger.warning(f"No response from Tello in {time_since_last_response:.1f} seconds, checking connection...")
                     # Send a status request to check if the drone is still responsive
                     self.tello_protocol.send_to_tello("command")
-                    
-            # Check if reconnection is needed
-            if need_reconnect:
-                logger.info("Reconnection request detected")
-                need_reconnect = False  # Reset the flag
+                else:
+                    # Nothing can go stale before the timeout expires
+                    sleep_time = max(check_interval, response_timeout - time_since_last_response)
+            
+            await asyncio.sleep(sleep_time)
     
-    async def _main_loop(self):
-        """Main loop that handles reconnection requests"""
-        global need_reconnect
+    async def _main_loop(self, retry_delay=5, max_retries=10):
+        """
+        Main loop that handles reconnection requests
         
+        This is the single owner of reconnections: the command protocol only sets
+        reconnect_event, and the retries with exponential backoff run here.
+        """
         try:
             while True:
-                if need_reconnect:
-                    logger.info("Recreating UDP socket connection")
-                    if self.cmd_transport:
-                        self.cmd_transport.close()
-                    self.cmd_transport, self.tello_protocol = await self._create_udp_socket()
-                    need_reconnect = False
-                    
-                    # After reconnecting, send command to initialize
-                    await asyncio.sleep(2)  # Wait for command mode to initialize
-                    self.tello_protocol.send_to_tello("command")
-                    
-                await asyncio.sleep(1)
+                # Sleep until a reconnection is requested
+                await self.reconnect_event.wait()
+                await self._reconnect(retry_delay, max_retries)
         except asyncio.CancelledError:
             logger.info("Main loop cancelled, shutting down")
         except Exception as e:
             logger.error(f"Error in main loop: {e}")
             raise
     
+    async def _reconnect(self, retry_delay, max_retries):
+        """
+        Recreate the command socket until the Tello answers
+        
+        The delay grows up to 30 seconds; after max_retries attempts an error is
+        logged but retries continue at the capped delay, so the bridge recovers
+        whenever the drone comes back.
+        """
+        logger.info("Starting reconnection attempts to Tello")
+        attempt = 0
+        
+        while True:
+            attempt += 1
+            logger.info(f"Reconnection attempt {attempt}")
+            
+            try:
+                if await self._reconnect_attempt(retry_delay):
+                    self.reconnect_event.clear()
+                    logger.info("Reconnected to Tello")
+                    return
+            except OSError as e:
+                # e.g. no route while the Wi-Fi is down, or the local port not released yet
+                logger.error(f"Error during reconnection: {e}")
+                await asyncio.sleep(retry_delay)
+            
+            if attempt == max_retries:
+                logger.error(f"Failed to reconnect to Tello after {max_retries} attempts, still retrying")
+            
+            # Exponential backoff with a cap
+            retry_delay = min(30, retry_delay * 1.5)
+    
+    async def _reconnect_attempt(self, retry_delay) -> bool:
+        """Recreate the command socket once and report whether the Tello answered"""
+        loop_time = asyncio.get_running_loop().time
+        
+        logger.info("Recreating UDP socket connection")
+        if self.cmd_transport:
+            self.cmd_transport.close()
+            # The socket is released on the next loop iteration, let it go before rebinding
+            await asyncio.sleep(0)
+        # The new protocol starts with an empty queue: commands queued on the previous one
+        # are stale (takeoff, flips, old rc values) and must not be replayed to the drone
+        self.cmd_transport, self.tello_protocol = await self._create_udp_socket()
+        # Drop the request raised by closing the previous socket
+        self.reconnect_event.clear()
+        
+        # After reconnecting, send command to initialize
+        await asyncio.sleep(2)  # Wait for command mode to initialize
+        probe_time = loop_time()
+        self.tello_protocol.send_to_tello("command")
+        
+        # Only an actual response means the drone is back
+        await asyncio.sleep(retry_delay)
+        return self.tello_protocol.last_response_time >= probe_time
+    
+    def send_to_tello(self, message: str):
+        """Send a command through the current command protocol"""
+        if self.tello_protocol:
+            self.tello_protocol.send_to_tello(message)
+        else:
+            logger.warning("Tello protocol not ready, message discarded")
+    
     async def stop(self):
         """Stop the bridge and cleanup resources"""
         logger.info("Stopping Tello Bridge...")
         
-        # Cancel the health monitor task
+        # Cancel the health monitor task and wait for it to finish
         if self.health_task:
             self.health_task.cancel()
+            await asyncio.gather(self.health_task, return_exceptions=True)
             
         # Close the WebSocket server
         if self.websocket_server:
-            self.websocket_server.close()
-            await self.websocket_server.wait_closed()
+            await stop_websocket_server(self.websocket_server)
             
         # Close all transports
         if self.cmd_transport:
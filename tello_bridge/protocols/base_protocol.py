@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import asyncio
+import time
 from typing import Optional, Tuple
 from ..utils.logger import logger
 
@@ -11,11 +12,15 @@ class BaseProtocol(asyncio.DatagramProtocol):
         self.transport = None
         self.connected = False
         self.last_response_time = 0
+        # Clock for last_response_time, replaced by the loop clock once connected
+        self._now = time.monotonic
         
     def connection_made(self, transport):
         """Called when a connection is made"""
         self.transport = transport
         self.connected = True
+        # Cache the loop clock, it is read on every received packet
+        self._now = asyncio.get_running_loop().time
         
     def connection_lost(self, exc):
         """Called when the connection is lost or closed"""
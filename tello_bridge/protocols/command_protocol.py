@@ -1,31 +1,54 @@
 #!/usr/bin/env python3
 import asyncio
-import json
-from typing import List, Optional
+from collections import deque
+from typing import Dict, List, Optional
 
 from ..utils.logger import logger
+from ..utils import serializer
 from .base_protocol import BaseProtocol
 
-# This needs to be imported in the main module and provided to TelloProtocol
-broadcast_to_websockets = None
+# Cache of encoded commands, bounded since clients can send arbitrary strings
+_CMD_CACHE: Dict[str, bytes] = {}
+_CMD_CACHE_SIZE = 256
+
+# Oldest queued commands are dropped past this size during long disconnects
+COMMAND_QUEUE_SIZE = 256
+
+def _encode_command(command: str) -> bytes:
+    """Encode a command, reusing the bytes of commands sent before"""
+    # rc stick values almost never repeat, so keep them out of the bounded cache
+    if command.startswith("rc "):
+        return command.encode('utf-8')
+    encoded = _CMD_CACHE.get(command)
+    if encoded is None:
+        encoded = command.encode('utf-8')
+        if len(_CMD_CACHE) < _CMD_CACHE_SIZE:
+            _CMD_CACHE[command] = encoded
+    return encoded
 
 class TelloProtocol(BaseProtocol):
     """
     Protocol for handling command communication with Tello drone
     """
-    def __init__(self, tello_addr, broadcast_function=None):
+    def __init__(self, tello_addr, broadcast_function=None, reconnect_event: Optional[asyncio.Event] = None):
         super().__init__()
         self.tello_addr = tello_addr
-        self.command_queue = []
-        self.reconnect_task = None
+        # Destination passed to sendto, None once the socket is connected to the Tello
+        self._send_addr = tello_addr
+        self.command_queue = deque(maxlen=COMMAND_QUEUE_SIZE)
         # Reference to the broadcast function
-        global broadcast_to_websockets
-        broadcast_to_websockets = broadcast_function
+        self._broadcast = broadcast_function
+        # Set to ask the bridge to recreate the socket
+        self.reconnect_event = reconnect_event
+        # Fixed-shape reply wrapper, only the data field is serialized per packet
+        self._pack_reply = serializer.template({"origin": "command"}, "data")
 
     def connection_made(self, transport):
         """Called when connection is established"""
         super().connection_made(transport)
         logger.info(f"UDP socket ready, sending to Tello at {self.tello_addr}")
+        if transport.get_extra_info('peername'):
+            self._send_addr = None
         # Process any queued commands
         self._process_command_queue()
         
@@ -34,27 +57,24 @@ class TelloProtocol(BaseProtocol):
 
     def datagram_received(self, data, addr):
         """Handle incoming data from the Tello drone"""
-        try:
-            message = data.decode('utf-8')
-            logger.debug(f"UDP message received from {addr}: {message}")
-            
-            # Update last response time for health monitoring
-            self.last_response_time = asyncio.get_event_loop().time()
-            
-            # Encapsulate response in JSON with origin=command
-            json_response = json.dumps({
-                "origin": "command",
-                "data": message
-            })
-            
-            # Schedule broadcasting to all WebSocket clients if a broadcast function is available
-            if broadcast_to_websockets:
-                asyncio.create_task(broadcast_to_websockets(json_response))
-            
-        except UnicodeDecodeError:
-            # This is likely binary data (possibly video), don't try to decode it as UTF-8
-            logger.debug(f"Binary data received from {addr}, size: {len(data)} bytes")
-            self.last_response_time = asyncio.get_event_loop().time()
+        # Update last response time for health monitoring
+        self.last_response_time = self._now()
+        
+        if not data.isascii():
+            # This is likely binary data (possibly video), don't try to decode it as text
+            logger.debug("Binary data received from %s, size: %d bytes", addr, len(data))
+            return
+        
+        # Command responses are short ASCII strings
+        message = data.decode('ascii')
+        logger.debug("UDP message received from %s: %s", addr, message)
+        
+        # Encapsulate response with origin=command
+        json_response = self._pack_reply(message)
+        
+        # Queue broadcasting to all WebSocket clients if a broadcast function is available
+        if self._broadcast:
+            self._broadcast(json_response)
 
     def send_to_tello(self, message: str):
         """Send a command to the Tello drone"""
@@ -68,10 +88,11 @@ class TelloProtocol(BaseProtocol):
             return
         
         if isinstance(message, str):
-            message = message.encode('utf-8')
+            message = _encode_command(message)
         
-        logger.debug(f"Sending to Tello: {message}")
-        self.transport.sendto(message, self.tello_addr)
+        logger.debug("Sending to Tello: %s", message)
+        # No address is needed when the socket is connected to the Tello
+        self.transport.sendto(message, self._send_addr)
 
     def _process_command_queue(self):
         """Process any commands that were queued while disconnected."""
@@ -79,9 +100,9 @@ class TelloProtocol(BaseProtocol):
             return
             
         logger.info(f"Processing {len(self.command_queue)} queued commands")
-        for cmd in self.command_queue:
-            self.send_to_tello(cmd)
-        self.command_queue = []
+        # Only drain what was queued so a re-queued command cannot loop forever
+        for _ in range(len(self.command_queue)):
+            self.send_to_tello(self.command_queue.popleft())
 
     def connection_lost(self, exc):
         """Handle connection loss"""
@@ -91,41 +112,16 @@ class TelloProtocol(BaseProtocol):
         
     def error_received(self, exc):
         """Handle transport errors"""
+        if isinstance(exc, ConnectionRefusedError):
+            # The socket is connected, so ICMP port-unreachable is reported here while
+            # the drone is not up yet. That is not a socket failure, keep the connection.
+            logger.debug("Tello not reachable yet: %s", exc)
+            return
         super().error_received(exc)
         # Start reconnection process
         self._schedule_reconnect()
         
     def _schedule_reconnect(self):
-        """Schedule a reconnection attempt."""
-        if self.reconnect_task and not self.reconnect_task.done():
-            return  # Reconnection already in progress
-            
-        self.reconnect_task = asyncio.create_task(self._reconnect())
-        
-    async def _reconnect(self):
-        """Attempt to reconnect to the Tello."""
-        logger.info("Starting reconnection attempts to Tello")
-        retry_delay = 5  # Start with 5 seconds delay
-        max_retries = 10  # Maximum number of retry attempts
-        retries = 0
-        
-        while not self.connected and retries < max_retries:
-            try:
-                logger.info(f"Reconnection attempt {retries + 1}/{max_retries}")
-                # Signal to the main loop that reconnection is needed
-                # This is used in the main module
-                global need_reconnect
-                need_reconnect = True
-                
-                await asyncio.sleep(retry_delay)
-                retries += 1
-                # Exponential backoff with a cap
-                retry_delay = min(30, retry_delay * 1.5)
-            except Exception as e:
-                logger.error(f"Error during reconnection: {e}")
-                
-        if not self.connected:
-            logger.error("Failed to reconnect to Tello after maximum retries")
-
-# Module-level variable for tracking reconnection needs
-need_reconnect = False
\ No newline at end of file
+        """Ask the bridge to reconnect, retries are handled by its main loop."""
+        if self.reconnect_event:
+            self.reconnect_event.set()
@@ -1,14 +1,84 @@
 #!/usr/bin/env python3
-import asyncio
-import json
+import re
 import time
 from typing import Dict, Any
 
 from ..utils.logger import logger
+from ..utils import serializer
 from .base_protocol import BaseProtocol
 
-# This needs to be imported in the main module and provided to TelloStateProtocol
-broadcast_to_websockets = None
+# Field descriptions for state parameters
+STATE_DESCRIPTIONS = {
+    "mid": "Mission Pad ID (-1 if not detected)",
+    "x": "X coordinate on Mission Pad (0 if not detected)",
+    "y": "Y coordinate on Mission Pad (0 if not detected)",
+    "z": "Z coordinate on Mission Pad (0 if not detected)",
+    "pitch": "Attitude pitch in degrees",
+    "roll": "Attitude roll in degrees",
+    "yaw": "Attitude yaw in degrees",
+    "vgx": "Speed on X axis",
+    "vgy": "Speed on Y axis",
+    "vgz": "Speed on Z axis",
+    "templ": "Lowest temperature in °C",
+    "temph": "Highest temperature in °C",
+    "tof": "Time of flight distance in cm",
+    "h": "Height in cm",
+    "bat": "Battery percentage",
+    "baro": "Barometer measurement in cm",
+    "time": "Motor time in seconds",
+    "agx": "Acceleration on X axis",
+    "agy": "Acceleration on Y axis",
+    "agz": "Acceleration on Z axis"
+}
+
+# Expected data types for parsing
+STATE_TYPES = {
+    "mid": int,
+    "x": int,
+    "y": int,
+    "z": int,
+    "pitch": float,
+    "roll": float,
+    "yaw": float,
+    "vgx": float,
+    "vgy": float,
+    "vgz": float,
+    "templ": float,
+    "temph": float,
+    "tof": float,
+    "h": float,
+    "bat": float,
+    "baro": float,
+    "time": float,
+    "agx": float,
+    "agy": float,
+    "agz": float
+}
+
+def _converter(value_type):
+    """Build a converter that falls back to the raw string if conversion fails"""
+    def convert(value: bytes):
+        try:
+            return value_type(value)
+        except ValueError:
+            return value.decode('ascii', errors='replace')
+    return convert
+
+# Bytes-keyed dispatch table mapping raw field names to (name, converter)
+_STATE_FIELDS = {
+    key.encode('ascii'): (key, _converter(value_type))
+    for key, value_type in STATE_TYPES.items()
+}
+
+# Matches "key:value" pairs of a ";" separated state packet, ignoring surrounding whitespace
+_STATE_RE = re.compile(rb'([^:;\s]+):([^;\s]*)')
+
+# Unchanged consecutive states are broadcast at most once per interval (seconds)
+STATE_REPEAT_INTERVAL = 0.5
+
+# Fields ignored when deciding whether the state changed: the barometer and
+# accelerometers are noisy even on the ground, and motor time alone is not news
+STATE_NOISY_FIELDS = frozenset({"baro", "agx", "agy", "agz", "time"})
 
 class TelloStateProtocol(BaseProtocol):
     """
@@ -18,138 +88,80 @@ class TelloStateProtocol(BaseProtocol):
         super().__init__()
         
         # Reference to the broadcast function
-        global broadcast_to_websockets
-        broadcast_to_websockets = broadcast_function
-        
-        # Define field descriptions for state parameters
-        self.state_descriptions = {
-            "mid": "Mission Pad ID (-1 if not detected)",
-            "x": "X coordinate on Mission Pad (0 if not detected)",
-            "y": "Y coordinate on Mission Pad (0 if not detected)",
-            "z": "Z coordinate on Mission Pad (0 if not detected)",
-            "pitch": "Attitude pitch in degrees",
-            "roll": "Attitude roll in degrees",
-            "yaw": "Attitude yaw in degrees",
-            "vgx": "Speed on X axis",
-            "vgy": "Speed on Y axis",
-            "vgz": "Speed on Z axis",
-            "templ": "Lowest temperature in °C",
-            "temph": "Highest temperature in °C",
-            "tof": "Time of flight distance in cm",
-            "h": "Height in cm",
-            "bat": "Battery percentage",
-            "baro": "Barometer measurement in cm",
-            "time": "Motor time in seconds",
-            "agx": "Acceleration on X axis",
-            "agy": "Acceleration on Y axis",
-            "agz": "Acceleration on Z axis"
-        }
+        self._broadcast = broadcast_function
         
-        # Define expected data types for parsing
-        self.state_types = {
-            "mid": int,
-            "x": int,
-            "y": int,
-            "z": int,
-            "pitch": float,
-            "roll": float,
-            "yaw": float,
-            "vgx": float,
-            "vgy": float,
-            "vgz": float,
-            "templ": float,
-            "temph": float,
-            "tof": float,
-            "h": float,
-            "bat": float,
-            "baro": float,
-            "time": float,
-            "agx": float,
-            "agy": float,
-            "agz": float
-        }
+        # Significant fields of the last broadcast state, used to coalesce unchanged states
+        self._last_significant = None
+        self._last_broadcast_time = 0
 
     def connection_made(self, transport):
         super().connection_made(transport)
         logger.info(f"UDP state server ready on port 8890")
         
-    def parse_state_data(self, state_string: str) -> Dict[str, Any]:
+    def parse_state_data(self, data: bytes) -> Dict[str, Any]:
         """
-        Parse the state string from Tello into a structured dictionary
+        Parse the raw state packet from Tello into a structured dictionary
         
         Args:
-            state_string (str): Raw state string from Tello
+            data (bytes): Raw ASCII state packet from Tello
             
         Returns:
-            Dict[str, Any]: Parsed state data
+            Dict[str, Any]: Parsed state data, unknown fields are kept as strings
         """
-        # Remove any trailing whitespace or newlines
-        state_string = state_string.strip()
-        
-        # Split the string into key-value pairs
-        pairs = state_string.split(';')
-        
-        # Initialize result dictionary
         state_data = {}
         
-        # Process each key-value pair
-        for pair in pairs:
-            if not pair:  # Skip empty pairs
-                continue
-                
-            # Split by colon to get key and value
-            if ':' in pair:
-                key, value = pair.split(':', 1)
-                
-                # Convert value to appropriate type if possible
-                try:
-                    if key in self.state_types:
-                        value = self.state_types[key](value)
-                except ValueError:
-                    # If conversion fails, keep as string
-                    pass
-                    
-                # Add to result dictionary
-                state_data[key] = value
+        # Walk the key:value pairs in a single pass, converting values to the appropriate type
+        for key, value in _STATE_RE.findall(data):
+            field = _STATE_FIELDS.get(key)
+            if field is None:
+                state_data[key.decode('ascii', errors='replace')] = value.decode('ascii', errors='replace')
+            else:
+                name, convert = field
+                state_data[name] = convert(value)
         
         return state_data
         
     def datagram_received(self, data, addr):
         """Handle incoming state data from Tello"""
-        try:
-            message = data.decode('utf-8')
-            logger.debug(f"Tello state received from {addr}: {message}")
-            
-            # Update last response time for health monitoring
-            self.last_response_time = asyncio.get_event_loop().time()
-            
-            # Parse the state data
-            state_data = self.parse_state_data(message)
-            
-            # Create enhanced state response with parsed data, raw data, and descriptions
-            enhanced_state = {
-                "origin": "state",
-                "raw": message,
-                "parsed": state_data,
-                "timestamp": time.time(),
-                "fields": {}
-            }
-            
-            # Add field descriptions and values in a structured way
-            for key, value in state_data.items():
-                enhanced_state["fields"][key] = {
-                    "value": value,
-                    "description": self.state_descriptions.get(key, "Unknown parameter")
-                }
-            
-            # Encapsulate state data in JSON
-            json_response = json.dumps(enhanced_state)
-            
-            # Broadcast state to all WebSocket clients if broadcast function is available
-            if broadcast_to_websockets:
-                asyncio.create_task(broadcast_to_websockets(json_response))
-            
-        except UnicodeDecodeError:
+        # Update last response time for health monitoring
+        now = self.last_response_time = self._now()
+        
+        if not data.isascii():
             # Handle binary data gracefully
-            logger.debug(f"Binary state data received from {addr}, size: {len(data)} bytes")
-            self.last_response_time = asyncio.get_event_loop().time()
\ No newline at end of file
+            logger.debug("Binary state data received from %s, size: %d bytes", addr, len(data))
+            return
+        
+        # Parse the state data straight from the bytes
+        state_data = self.parse_state_data(data)
+        
+        # Skip states where only noisy fields changed (idle drone), but still repeat them periodically
+        significant = {key: value for key, value in state_data.items() if key not in STATE_NOISY_FIELDS}
+        if significant == self._last_significant and now - self._last_broadcast_time < STATE_REPEAT_INTERVAL:
+            return
+        
+        # State packets are ASCII, only decode for the raw field
+        message = data.decode('ascii')
+        logger.debug("Tello state received from %s: %s", addr, message)
+        
+        # Create enhanced state response with parsed data, raw data, and descriptions
+        enhanced_state = {
+            "origin": "state",
+            "raw": message,
+            "parsed": state_data,
+            "timestamp": time.time(),
+            # Add field descriptions and values in a structured way
+            "fields": {
+                key: {"value": value, "description": STATE_DESCRIPTIONS.get(key, "Unknown parameter")}
+                for key, value in state_data.items()
+            }
+        }
+        
+        # Encapsulate state data in JSON
+        json_response = serializer.dumps(enhanced_state)
+        
+        # Broadcast state to all WebSocket clients if broadcast function is available
+        if self._broadcast:
+            self._broadcast(json_response)
+        
+        self._last_significant = significant
+        self._last_broadcast_time = now
@@ -18,7 +18,8 @@ def setup_logger(debug=True):
     logging.basicConfig(
         level=logging.DEBUG if debug else logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        stream=sys.stdout
+        stream=sys.stdout,
+        force=True  # Replace the default configuration made at import time
     )
     
     # Create and return logger
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+from typing import Any, Callable, Dict, List
+
+# Prefer orjson (C implementation returning bytes), fall back to the stdlib
+try:
+    import orjson
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes"""
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+    
+    def _json_dumps(obj: Any) -> bytes:
+        """Serialize an object to JSON bytes"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# MessagePack is optional and only needed for the "msgpack" wire format
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+WIRE_FORMATS = ("json", "msgpack")
+
+def _json_pack_batch(messages: List[bytes]) -> bytes:
+    """Join already serialized JSON messages into a single JSON array"""
+    return b'[' + b','.join(messages) + b']'
+
+def _json_template(fixed: Dict[str, Any], key: str) -> Callable[[Any], bytes]:
+    """Precompose a JSON object with fixed fields, leaving the value of key to fill in"""
+    prefix = _json_dumps(fixed)[:-1] + (b',' if fixed else b'') + _json_dumps(key) + b':'
+    return lambda value: prefix + _json_dumps(value) + b'}'
+
+_packer = msgpack.Packer(use_bin_type=True) if msgpack else None
+
+def _msgpack_dumps(obj: Any) -> bytes:
+    """Serialize an object to MessagePack bytes"""
+    return _packer.pack(obj)
+
+def _msgpack_pack_batch(messages: List[bytes]) -> bytes:
+    """Join already serialized MessagePack messages into a single MessagePack array"""
+    return _packer.pack_array_header(len(messages)) + b''.join(messages)
+
+def _msgpack_template(fixed: Dict[str, Any], key: str) -> Callable[[Any], bytes]:
+    """Precompose a MessagePack map with fixed fields, leaving the value of key to fill in"""
+    prefix = _packer.pack_map_header(len(fixed) + 1)
+    prefix += b''.join(_packer.pack(k) + _packer.pack(v) for k, v in fixed.items())
+    prefix += _packer.pack(key)
+    return lambda value: prefix + _packer.pack(value)
+
+# Active serializer, selected with setup_serializer
+dumps = _json_dumps
+pack_batch = _json_pack_batch
+template = _json_template
+
+def setup_serializer(wire_format="json"):
+    """
+    Select the wire format used for messages sent to WebSocket clients
+    
+    Args:
+        wire_format (str): Either "json" or "msgpack"
+    
+    Raises:
+        ValueError: If the format is unknown
+        ImportError: If "msgpack" is requested but the msgpack package is not installed
+    """
+    global dumps, pack_batch, template
+    
+    if wire_format not in WIRE_FORMATS:
+        raise ValueError(f"Unknown wire format: {wire_format}")
+    
+    if wire_format == "msgpack":
+        if msgpack is None:
+            raise ImportError("The msgpack package is required for the msgpack wire format")
+        dumps = _msgpack_dumps
+        pack_batch = _msgpack_pack_batch
+        template = _msgpack_template
+    else:
+        dumps = _json_dumps
+        pack_batch = _json_pack_batch
+        template = _json_template
@@ -1,13 +1,26 @@
 #!/usr/bin/env python3
 import asyncio
 import websockets
-from typing import Set, Optional, Callable, Any
+from collections import deque
+from typing import Deque, Set, Optional, Callable, Any
 
 from ..utils.logger import logger
+from ..utils import serializer
 
 # Set to store active WebSocket connections
 connected_websockets: Set = set()
 
+# Batching window: flush every BATCH_INTERVAL seconds or BATCH_MAX_ITEMS messages
+BATCH_INTERVAL = 0.02
+BATCH_MAX_ITEMS = 50
+
+# Messages are dropped once this many are waiting to be broadcast
+BROADCAST_QUEUE_SIZE = 1024
+
+# Created in start_websocket_server so they bind to the running event loop
+broadcast_queue: Optional[asyncio.Queue] = None
+_broadcaster_task: Optional[asyncio.Task] = None
+
 async def handle_websocket(websocket, tello_command_handler=None):
     """
     Handle WebSocket connections and messages.
@@ -21,13 +34,21 @@ async def handle_websocket(websocket, tello_command_handler=None):
     # Register the new WebSocket
     connected_websockets.add(websocket)
     
+    # Forward commands from a separate task so a burst of rc commands is coalesced
+    commands: Deque = deque()
+    commands_ready = asyncio.Event()
+    forward_task = None
+    if tello_command_handler:
+        forward_task = asyncio.create_task(_forward_commands(commands, commands_ready, tello_command_handler))
+    
     try:
         async for message in websocket:
-            logger.debug(f"WebSocket message received: {message}")
+            logger.debug("WebSocket message received: %s", message)
             
             # Send message to Tello if handler is ready
-            if tello_command_handler:
-                tello_command_handler(message)
+            if forward_task:
+                _queue_command(commands, message)
+                commands_ready.set()
             else:
                 logger.warning("Tello command handler not ready, message discarded")
             
@@ -36,19 +57,77 @@ async def handle_websocket(websocket, tello_command_handler=None):
     finally:
         # Unregister the WebSocket when connection is closed
         connected_websockets.remove(websocket)
+        if forward_task:
+            forward_task.cancel()
+
+def _is_rc_command(message) -> bool:
+    """Whether the message is an rc stick command, of which only the latest matters"""
+    return isinstance(message, str) and message.startswith("rc ")
+
+def _queue_command(commands: Deque, message):
+    """
+    Queue a client command for forwarding.
+    
+    A new rc command replaces an rc command still pending at the tail of the
+    queue, so consecutive stick updates collapse to the latest one without
+    reordering them around other commands. Other commands are never dropped.
+    """
+    if commands and _is_rc_command(message) and _is_rc_command(commands[-1]):
+        commands[-1] = message
+    else:
+        commands.append(message)
+
+async def _forward_commands(commands: Deque, commands_ready: asyncio.Event, tello_command_handler):
+    """Forward queued client commands to the Tello in order"""
+    while True:
+        await commands_ready.wait()
+        commands_ready.clear()
+        
+        while commands:
+            message = commands.popleft()
+            try:
+                tello_command_handler(message)
+            except Exception as e:
+                # Keep forwarding the client's other commands
+                logger.error(f"Error forwarding command {message!r}: {e}")
+
+async def _broadcaster():
+    """
+    Drain the broadcast queue and send each batch to all clients as a single binary array frame.
+    
+    Waits for a message, lets the batching window fill for BATCH_INTERVAL
+    seconds (unless enough messages are already queued), then sends at most
+    BATCH_MAX_ITEMS messages per frame.
+    """
+    while True:
+        batch = [await broadcast_queue.get()]
+        
+        # Give the window a chance to fill up before writing
+        if broadcast_queue.qsize() < BATCH_MAX_ITEMS - 1:
+            await asyncio.sleep(BATCH_INTERVAL)
+        while len(batch) < BATCH_MAX_ITEMS and not broadcast_queue.empty():
+            batch.append(broadcast_queue.get_nowait())
+        
+        if connected_websockets:
+            # Write the frame to every client without awaiting per-client flow control
+            websockets.broadcast(connected_websockets, serializer.pack_batch(batch))
 
-async def broadcast_to_websockets(message: str):
+def broadcast_to_websockets(message: bytes):
     """
-    Send message to all connected WebSocket clients.
+    Queue a message for all connected WebSocket clients.
+    
+    Messages are batched by the broadcaster task and delivered as arrays in the configured wire format.
     
     Args:
-        message: The message to broadcast
+        message: The serialized message to broadcast
     """
-    if connected_websockets:
-        # Create a list of tasks to send the message to all WebSockets
-        tasks = [ws.send(message) for ws in connected_websockets]
-        # Execute all send tasks concurrently
-        await asyncio.gather(*tasks, return_exceptions=True)
+    if not connected_websockets or broadcast_queue is None:
+        return
+    
+    try:
+        broadcast_queue.put_nowait(message)
+    except asyncio.QueueFull:
+        logger.warning("Broadcast queue full, dropping message")
 
 async def start_websocket_server(host: str, port: int, tello_command_handler: Optional[Callable[[str], Any]] = None):
     """
@@ -62,6 +141,12 @@ async def start_websocket_server(host: str, port: int, tello_command_handler: Op
     Returns:
         The WebSocket server instance
     """
+    global broadcast_queue, _broadcaster_task
+    
+    # Start the single broadcaster draining the queue
+    broadcast_queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_SIZE)
+    _broadcaster_task = asyncio.create_task(_broadcaster())
+    
     # Create a custom handler that includes the tello_command_handler
     async def handler(websocket):
         await handle_websocket(websocket, tello_command_handler)
@@ -76,4 +161,18 @@ async def start_websocket_server(host: str, port: int, tello_command_handler: Op
     )
     
     logger.info(f"WebSocket server started on {host}:{port}")
-    return server
\ No newline at end of file
+    return server
+
+
+async def stop_websocket_server(server):
+    """
+    Stop the broadcaster and close the WebSocket server
+    
+    Args:
+        server: The WebSocket server instance returned by start_websocket_server
+    """
+    if _broadcaster_task:
+        _broadcaster_task.cancel()
+    
+    server.close()
+    await server.wait_closed()